@@ -14,22 +14,33 @@ Features:
 """
 
 import os
-import json
+import re
 import time
+import uuid
+import queue
 import threading
 import logging
+import hashlib
+from collections import deque
 from datetime import datetime
 from typing import Dict, List
 from functools import wraps
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 
-from flask import Flask, render_template, request, jsonify, Response, send_file
+from flask import Flask, render_template, request, jsonify, Response
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-from pymongo import MongoClient, ASCENDING, DESCENDING
-from pymongo.errors import PyMongoError
+from pymongo import MongoClient, ASCENDING, DESCENDING, IndexModel, UpdateOne
+from pymongo.errors import DuplicateKeyError, PyMongoError
 from bson import ObjectId
+from bson.regex import Regex
+from cachetools import TTLCache
 from dotenv import load_dotenv
+import click
+import orjson
 import requests
-import tempfile
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ---------------------------
 # Logging Configuration
@@ -51,20 +62,51 @@ if not MONGO_URI:
 
 DB_NAME = os.getenv("MONGO_DB", "translation")
 TRANSLATION_SERVICE_URL = os.getenv("TRANSLATION_SERVICE_URL", "http://localhost:4000")
+# Autofill keeps WORKERS x BATCH_SIZE texts queued at the Node service, which
+# runs at most TRANSLATE_CONCURRENCY (default 8) Google calls at once; keep
+# the product a small multiple of that so batches finish well within timeout
+TRANSLATION_BATCH_SIZE = int(os.getenv("TRANSLATION_BATCH_SIZE", "16"))
+TRANSLATION_WORKERS = int(os.getenv("TRANSLATION_WORKERS", "2"))
+BULK_WRITE_BATCH_SIZE = 500
 
 # App settings
 PORT = int(os.getenv("PORT", "5000"))
 DEBUG = os.getenv("FLASK_DEBUG", "False").lower() in ("1", "true", "yes")
+INIT_DB_ON_STARTUP = os.getenv("INIT_DB_ON_STARTUP", "True").lower() in ("1", "true", "yes")
 
 # ---------------------------
 # Flask + MongoDB Initialization
 # ---------------------------
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for jsonify and request.get_json"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__, static_folder="static", template_folder="templates")
+app.json = ORJSONProvider(app)
 CORS(app)
 
 # MongoDB connection with error handling
 try:
-    client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000)
+    # Pool sized for concurrent Flask threads plus long-lived SSE clients;
+    # short selection/connect timeouts keep /health from stalling on outages.
+    # minPoolSize keeps warm sockets open in the background, and wire
+    # compression cuts bytes for list/export responses from Atlas.
+    client = MongoClient(
+        MONGO_URI,
+        maxPoolSize=200,
+        minPoolSize=10,
+        maxIdleTimeMS=300000,
+        serverSelectionTimeoutMS=3000,
+        socketTimeoutMS=10000,
+        connectTimeoutMS=3000,
+        retryWrites=True,
+        compressors="zstd,zlib"
+    )
     client.admin.command('ping')
     db = client[DB_NAME]
     translations_col = db["translations"]
@@ -74,28 +116,48 @@ except PyMongoError as e:
     logger.error(f"MongoDB connection failed: {e}")
     raise
 
-# Create indexes for better performance
-try:
-    translations_col.create_index([("key", ASCENDING)], unique=True)
-    translations_col.create_index([("created_at", DESCENDING)])
-    languages_col.create_index([("code", ASCENDING)], unique=True)
-    logger.info("Database indexes created successfully")
-except Exception as e:
-    logger.warning(f"Index creation warning: {e}")
+# Fields backed by an index that list requests may sort on
+SORTABLE_FIELDS = {"key", "updated_at", "created_at"}
+
+# Fields list requests may project; values may be narrowed to single languages
+LIST_DEFAULT_FIELDS = ["key", "values", "created_at", "updated_at"]
+LIST_FIELD_PATTERN = re.compile(r"key|created_at|updated_at|values(\.[\w-]+)?")
 
 # ---------------------------
 # SSE Event Management
 # ---------------------------
-SSE_EVENTS = []
-SSE_LOCK = threading.Lock()
 MAX_EVENTS = 300
+# (event id, frame) history replayed to clients reconnecting with Last-Event-ID
+SSE_EVENTS = deque(maxlen=MAX_EVENTS)
+SSE_SUBSCRIBERS = set()
+SSE_LOCK = threading.Lock()
+SSE_QUEUE_SIZE = 256
+EVENT_GENERATION = 0
+SSE_KEEPALIVE_SECONDS = 15
 
 def push_event(event: Dict):
     """Push event to SSE stream"""
+    global EVENT_GENERATION
+    event = {"ts": time.time(), **event}
+    # Serialize once; every subscriber receives the same wire frame
+    data = b"data: " + orjson.dumps(event) + b"\n\n"
     with SSE_LOCK:
-        SSE_EVENTS.append({"ts": time.time(), **event})
-        if len(SSE_EVENTS) > MAX_EVENTS:
-            SSE_EVENTS.pop(0)
+        # Every event follows a write, so it also invalidates cached pages;
+        # the generation doubles as the SSE event id
+        EVENT_GENERATION += 1
+        frame = b"id: %d\n" % EVENT_GENERATION + data
+        SSE_EVENTS.append((EVENT_GENERATION, frame))
+        subscribers = list(SSE_SUBSCRIBERS)
+    for subscriber in subscribers:
+        try:
+            subscriber.put_nowait(frame)
+        except queue.Full:
+            # Slow client: drop its oldest pending frame
+            try:
+                subscriber.get_nowait()
+                subscriber.put_nowait(frame)
+            except (queue.Empty, queue.Full):
+                pass
     logger.info(f"Event pushed: {event.get('type')}")
 
 # ---------------------------
@@ -131,22 +193,59 @@ STANDARD_LANGUAGES = [
     {"code": "fi", "name": "Finnish"}
 ]
 
+# ---------------------------
+# In-process Caching
+# ---------------------------
+# cachetools caches are not thread-safe; guard every access with CACHE_LOCK
+CACHE_LOCK = threading.RLock()
+TRANSLATION_CACHE = TTLCache(maxsize=50_000, ttl=3600)
+LANGUAGES_CACHE = TTLCache(maxsize=1, ttl=30)
+LANGUAGES_CACHE_KEY = "__langs__"
+# (generation, etag, body) of the unsearched first list page per view
+FIRST_PAGE_CACHE = TTLCache(maxsize=64, ttl=5)
+
 # ---------------------------
 # Translation Service Integration
 # ---------------------------
-def call_translation_service(text: str, target_languages: List[str]) -> Dict:
-    """Call Node.js translation microservice"""
+# One pooled session for the process lifetime so calls reuse keep-alive
+# connections instead of paying a fresh handshake per request.
+TRANSLATION_SESSION = requests.Session()
+_translation_adapter = HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=50,
+    # read=0: a slow translation must not be re-sent after its 30s timeout;
+    # only connection failures and retryable statuses are retried
+    max_retries=Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.2,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset(["GET", "POST"])
+    )
+)
+TRANSLATION_SESSION.mount("http://", _translation_adapter)
+TRANSLATION_SESSION.mount("https://", _translation_adapter)
+
+# Health probes keep their own small keep-alive pool without retries, so a
+# hung service fails fast instead of stalling the probe through backoff
+HEALTH_SESSION = requests.Session()
+_health_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+HEALTH_SESSION.mount("http://", _health_adapter)
+HEALTH_SESSION.mount("https://", _health_adapter)
+
+def _post_translation_service(path: str, payload: Dict, empty_result) -> Dict:
+    """POST to the Node.js translation microservice and unwrap its response"""
     try:
-        response = requests.post(
-            f"{TRANSLATION_SERVICE_URL}/translate",
-            json={"text": text, "languages": target_languages},
+        response = TRANSLATION_SESSION.post(
+            f"{TRANSLATION_SERVICE_URL}{path}",
+            json=payload,
             timeout=30
         )
         response.raise_for_status()
         data = response.json()
         
         if data.get("success"):
-            return {"success": True, "translations": data.get("translations", {})}
+            return {"success": True, "translations": data.get("translations", empty_result)}
         else:
             return {"success": False, "error": data.get("error", "Translation service error")}
     
@@ -160,8 +259,197 @@ def call_translation_service(text: str, target_languages: List[str]) -> Dict:
         logger.error(f"Translation service error: {e}")
         return {"success": False, "error": str(e)}
 
+def translation_cache_key(text: str, lang: str):
+    """Cache key for a (text, language) pair; hashing keeps long texts out of the key"""
+    return (lang, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+
+def cached_translations(text: str, target_languages: List[str]):
+    """Split target languages into (translations known without a call, languages to request)"""
+    # Blank text and English targets translate to themselves
+    if not text or not text.strip():
+        return {lang: text for lang in target_languages}, []
+
+    translations = {}
+    missing = []
+    with CACHE_LOCK:
+        for lang in target_languages:
+            if lang == "en":
+                translations[lang] = text
+                continue
+            cached = TRANSLATION_CACHE.get(translation_cache_key(text, lang))
+            if cached is None:
+                missing.append(lang)
+            else:
+                translations[lang] = cached
+    return translations, missing
+
+def cache_translations(text: str, translations: Dict):
+    """Remember service results, skipping its "[lang] text" fallback for failed languages"""
+    with CACHE_LOCK:
+        for lang, value in translations.items():
+            if value != f"[{lang}] {text}":
+                TRANSLATION_CACHE[translation_cache_key(text, lang)] = value
+
+def call_translation_service(text: str, target_languages: List[str]) -> Dict:
+    """Call Node.js translation microservice, skipping languages already cached"""
+    translations, missing = cached_translations(text, target_languages)
+    if not missing:
+        return {"success": True, "translations": translations}
+
+    result = _post_translation_service(
+        "/translate",
+        {"text": text, "languages": missing},
+        {}
+    )
+    if not result.get("success"):
+        # Still hand back the cached hits alongside the error
+        return {**result, "translations": translations}
+
+    fetched = result.get("translations", {})
+    cache_translations(text, fetched)
+    translations.update(fetched)
+    return {"success": True, "translations": translations}
+
+def call_translation_service_batch(texts: List[str], target_languages: List[str]) -> Dict:
+    """Translate many texts in one call; translations[i] maps language -> text for texts[i]"""
+    results = []
+    pending = []
+    for i, text in enumerate(texts):
+        translations, missing = cached_translations(text, target_languages)
+        results.append(translations)
+        if missing:
+            pending.append(i)
+
+    # Only texts with a cache miss go to the service
+    if pending:
+        result = _post_translation_service(
+            "/translate/batch",
+            {"texts": [texts[i] for i in pending], "languages": target_languages},
+            []
+        )
+        if not result.get("success"):
+            # Keep whatever the cache already had
+            return {**result, "translations": results}
+        for i, fetched in zip(pending, result.get("translations", [])):
+            fetched = fetched or {}
+            cache_translations(texts[i], fetched)
+            results[i].update(fetched)
+
+    return {"success": True, "translations": results}
+
+def translate_values(en_value: str, target_languages: List[str]) -> Dict:
+    """Translate English text into every target language with a single service call"""
+    values = {"en": en_value}
+    if not target_languages:
+        return values
+
+    result = call_translation_service(en_value, target_languages)
+    if not result.get("success"):
+        logger.warning(f"Translation service error: {result.get('error')}")
+    translations = result.get("translations", {})
+
+    for lang in target_languages:
+        # Use fallback format for anything the service didn't return
+        values[lang] = translations.get(lang, f"[{lang}] {en_value}")
+    return values
+
+def backfill_language_batch(code: str, batch: List) -> List[UpdateOne]:
+    """Translate a batch of (_id, english) pairs into `code` and build the matching update ops"""
+    result = call_translation_service_batch([en_value for _, en_value in batch], [code])
+    failed = not result.get("success")
+    if failed:
+        logger.warning(f"Batch translation failed for {code}: {result.get('error')}")
+
+    now = datetime.utcnow()
+    ops = []
+    for (tid, en_value), translations in zip(batch, result.get("translations", [])):
+        translations = translations or {}
+        if failed and code not in translations:
+            # Leave it for a later backfill rather than storing a fallback
+            continue
+        new_value = translations.get(code, f"[{code}] {en_value}")
+        ops.append(UpdateOne(
+            {"_id": tid},
+            {"$set": {f"values.{code}": new_value, "updated_at": now}}
+        ))
+    return ops
+
+# ---------------------------
+# Background Jobs
+# ---------------------------
+# Autofill jobs run one at a time; each already fans out to TRANSLATION_WORKERS
+AUTOFILL_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autofill")
+
+def autofill_language(code: str, name: str, job_id: str):
+    """Translate every existing key into a newly added language, reporting progress over SSE"""
+    try:
+        has_english = {"values.en": {"$exists": True, "$ne": ""}}
+        total = translations_col.count_documents(has_english)
+
+        existing_count = 0
+        ops = []
+
+        def collect(futures):
+            """Queue finished batches' updates, flushing every BULK_WRITE_BATCH_SIZE ops"""
+            nonlocal existing_count
+            for future in futures:
+                ops.extend(future.result())
+                if len(ops) >= BULK_WRITE_BATCH_SIZE:
+                    translations_col.bulk_write(ops, ordered=False)
+                    existing_count += len(ops)
+                    ops.clear()
+                    push_event({
+                        "type": "autofill_progress",
+                        "job_id": job_id,
+                        "code": code,
+                        "done": existing_count,
+                        "total": total
+                    })
+
+        # Translate existing keys in concurrent batches, keeping at most
+        # TRANSLATION_WORKERS batches in flight so memory stays bounded
+        with ThreadPoolExecutor(max_workers=TRANSLATION_WORKERS) as executor:
+            in_flight = set()
+            batch = []
+            for translation in translations_col.find(has_english, {"_id": 1, "values.en": 1}).batch_size(500):
+                en_value = (translation.get("values") or {}).get("en", "")
+                if en_value:
+                    batch.append((translation["_id"], en_value))
+                if len(batch) >= TRANSLATION_BATCH_SIZE:
+                    in_flight.add(executor.submit(backfill_language_batch, code, batch))
+                    batch = []
+                    if len(in_flight) >= TRANSLATION_WORKERS:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        collect(done)
+            if batch:
+                in_flight.add(executor.submit(backfill_language_batch, code, batch))
+            collect(as_completed(in_flight))
+
+        if ops:
+            translations_col.bulk_write(ops, ordered=False)
+            existing_count += len(ops)
+
+        push_event({
+            "type": "autofill_done",
+            "job_id": job_id,
+            "code": code,
+            "name": name,
+            "translations_updated": existing_count
+        })
+        logger.info(f"Autofill for {code} finished, {existing_count} translations updated")
+
+    except Exception as e:
+        logger.error(f"Error auto-filling language {code}: {e}")
+        push_event({
+            "type": "autofill_done",
+            "job_id": job_id,
+            "code": code,
+            "name": name,
+            "error": "Failed to auto-translate existing keys"
+        })
+
 # ---------------------------
-# Initialize Default Languages
+# Database Initialization
 # ---------------------------
 def init_default_languages():
     """Initialize database with default languages"""
@@ -177,22 +465,68 @@ def init_default_languages():
     except Exception as e:
         logger.error(f"Error initializing languages: {e}")
 
-init_default_languages()
+def ensure_indexes(strict: bool = False) -> bool:
+    """Create collection indexes, one batched command per collection"""
+    try:
+        translations_col.create_indexes([
+            IndexModel([("key", ASCENDING)], unique=True),
+            IndexModel([("created_at", DESCENDING)]),
+            IndexModel([("updated_at", DESCENDING)]),
+            # Values span many languages, so skip English stemming and stop words
+            IndexModel([("$**", "text")], default_language="none")
+        ])
+        languages_col.create_indexes([IndexModel([("code", ASCENDING)], unique=True)])
+        logger.info("Database indexes created successfully")
+        return True
+    except Exception as e:
+        # The unique indexes are the only duplicate check, so init-db must fail loudly
+        if strict:
+            raise
+        logger.warning(f"Index creation warning: {e}")
+        return False
+
+_DB_INITIALIZED = False
+
+def init_db(strict: bool = False):
+    """Create indexes and default languages, at most once per process"""
+    global _DB_INITIALIZED
+    if _DB_INITIALIZED:
+        return
+    if not ensure_indexes(strict):
+        # Leave the flag unset so a later (strict) call retries
+        return
+    init_default_languages()
+    _DB_INITIALIZED = True
+
+@app.cli.command("init-db")
+def init_db_command():
+    """Create indexes and default languages"""
+    # No-op if the import-time call below already ran in this process
+    try:
+        init_db(strict=True)
+    except PyMongoError as e:
+        raise click.ClickException(f"Index creation failed: {e}")
+
+# Serverless deployments can skip this and run `flask --app app init-db` once
+if INIT_DB_ON_STARTUP:
+    init_db()
 
 # ---------------------------
 # Utility Functions
 # ---------------------------
-def serialize_doc(doc):
-    """Convert MongoDB document to JSON-serializable format"""
-    if doc is None:
-        return None
-    doc_copy = dict(doc)
-    doc_copy["_id"] = str(doc_copy["_id"])
-    if "created_at" in doc_copy:
-        doc_copy["created_at"] = doc_copy["created_at"].isoformat()
-    if "updated_at" in doc_copy:
-        doc_copy["updated_at"] = doc_copy["updated_at"].isoformat()
-    return doc_copy
+def get_languages_cached() -> List[Dict]:
+    """Configured languages, cached briefly since they rarely change"""
+    with CACHE_LOCK:
+        langs = LANGUAGES_CACHE.get(LANGUAGES_CACHE_KEY)
+    if langs is None:
+        langs = list(languages_col.find({}, {"_id": 0}))
+        with CACHE_LOCK:
+            LANGUAGES_CACHE[LANGUAGES_CACHE_KEY] = langs
+    return langs
+
+def get_target_language_codes() -> List[str]:
+    """Codes of every configured language except English, from the cached list"""
+    return [lang["code"] for lang in get_languages_cached() if lang["code"] != "en"]
 
 def error_response(message: str, status_code: int = 400):
     """Standard error response"""
@@ -226,7 +560,7 @@ def internal_error(e):
 def index():
     """Render main application page"""
     try:
-        langs = list(languages_col.find({}, {"_id": 0}))
+        langs = get_languages_cached()
         return render_template("index.html", languages=langs, standard_languages=STANDARD_LANGUAGES)
     except Exception as e:
         logger.error(f"Error rendering index: {e}")
@@ -238,18 +572,27 @@ def index():
 @app.route("/stream")
 def stream():
     """Server-Sent Events endpoint for real-time updates"""
+    # Browsers send the last id they saw when reconnecting
+    last_event_id = request.headers.get("Last-Event-ID", type=int)
+
     def event_generator():
-        last_index = 0
-        while True:
+        subscriber = queue.Queue(maxsize=SSE_QUEUE_SIZE)
+        with SSE_LOCK:
+            SSE_SUBSCRIBERS.add(subscriber)
+            missed = []
+            if last_event_id is not None:
+                missed = [frame for event_id, frame in SSE_EVENTS if event_id > last_event_id]
+        try:
+            for frame in missed:
+                yield frame
+            while True:
+                try:
+                    yield subscriber.get(timeout=SSE_KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    yield b": keepalive\n\n"
+        finally:
             with SSE_LOCK:
-                events = SSE_EVENTS[:]
-            
-            if last_index < len(events):
-                for event in events[last_index:]:
-                    yield f"data: {json.dumps(event)}\n\n"
-                last_index = len(events)
-            
-            time.sleep(1)
+                SSE_SUBSCRIBERS.discard(subscriber)
     
     return Response(event_generator(), mimetype="text/event-stream")
 
@@ -260,7 +603,7 @@ def stream():
 def api_get_languages():
     """Get all configured languages"""
     try:
-        langs = list(languages_col.find({}, {"_id": 0}))
+        langs = get_languages_cached()
         return success_response({"languages": langs})
     except Exception as e:
         logger.error(f"Error fetching languages: {e}")
@@ -282,50 +625,35 @@ def api_add_language():
         if not code or not name:
             return error_response("Language code and name are required")
 
-        # Check if language already exists
-        if languages_col.find_one({"code": code}):
+        # Insert new language; the unique index on code rejects duplicates
+        try:
+            languages_col.insert_one({
+                "code": code,
+                "name": name,
+                "is_default": False
+            })
+        except DuplicateKeyError:
             return error_response("Language already exists")
+        with CACHE_LOCK:
+            LANGUAGES_CACHE.pop(LANGUAGES_CACHE_KEY, None)
 
-        # Insert new language
-        languages_col.insert_one({
-            "code": code,
-            "name": name,
-            "is_default": False
-        })
-
-        # Auto-translate existing keys to new language
-        existing_count = 0
-        for translation in translations_col.find({}):
-            en_value = (translation.get("values") or {}).get("en", "")
-            if en_value:
-                result = call_translation_service(en_value, [code])
-                if result.get("success"):
-                    translations = result.get("translations", {})
-                    new_value = translations.get(code, f"[{code}] {en_value}")
-                    translations_col.update_one(
-                        {"_id": translation["_id"]},
-                        {
-                            "$set": {
-                                f"values.{code}": new_value,
-                                "updated_at": datetime.utcnow()
-                            }
-                        }
-                    )
-                    existing_count += 1
-
+        job_id = uuid.uuid4().hex
         push_event({
             "type": "language_added",
             "code": code,
             "name": name,
-            "translations_updated": existing_count
+            "job_id": job_id
         })
 
-        logger.info(f"Language added: {code} ({name}), {existing_count} translations updated")
+        # Auto-translate existing keys off the request thread
+        AUTOFILL_EXECUTOR.submit(autofill_language, code, name, job_id)
+
+        logger.info(f"Language added: {code} ({name}), autofill job {job_id} started")
         return success_response({
             "code": code,
             "name": name,
-            "translations_updated": existing_count
-        })
+            "job_id": job_id
+        }), 202
 
     except Exception as e:
         logger.error(f"Error adding language: {e}")
@@ -339,36 +667,113 @@ def api_list_translations():
     """List translations with search, pagination and sorting"""
     try:
         query_text = request.args.get("q", "").strip()
-        page = max(1, int(request.args.get("page", "1")))
-        per_page = max(1, min(100, int(request.args.get("per", "20"))))
+        page = max(1, request.args.get("page", 1, type=int))
+        per_page = max(1, min(100, request.args.get("per", 20, type=int)))
         sort_by = request.args.get("sort", "key")
         order = request.args.get("order", "asc")
+        after_key = request.args.get("after", "").strip()
 
-        # Build query
-        query = {}
-        if query_text:
-            query = {
-                "$or": [
-                    {"key": {"$regex": query_text, "$options": "i"}},
-                    {"values": {"$regex": query_text, "$options": "i"}}
-                ]
-            }
+        # Only sort on indexed fields
+        if sort_by not in SORTABLE_FIELDS:
+            sort_by = "key"
+        if order not in ("asc", "desc"):
+            order = "asc"
 
         # Sort direction
         sort_dir = ASCENDING if order == "asc" else DESCENDING
 
-        # Execute query
-        cursor = translations_col.find(query).sort(sort_by, sort_dir).skip((page - 1) * per_page).limit(per_page)
-        total = translations_col.count_documents(query)
-        docs = [serialize_doc(d) for d in cursor]
+        # Only fetch the requested fields
+        fields = [f.strip() for f in request.args.get("fields", "").split(",") if f.strip()]
+        if not fields:
+            fields = LIST_DEFAULT_FIELDS
+        if not all(LIST_FIELD_PATTERN.fullmatch(f) for f in fields):
+            return error_response("Invalid fields parameter")
+        # Drop duplicates and values.<code> paths already covered by values,
+        # which MongoDB would reject as a projection path collision
+        fields = [
+            f for i, f in enumerate(fields)
+            if f not in fields[:i] and not (f.startswith("values.") and "values" in fields)
+        ]
+        projection = {f: 1 for f in fields}
+
+        # The unsearched first page is the UI's initial load; serve it from a
+        # short-lived cache that any write event invalidates
+        cache_key = None
+        if not query_text and page == 1 and not after_key:
+            cache_key = (per_page, sort_by, order, tuple(fields))
+            generation = EVENT_GENERATION
+            with CACHE_LOCK:
+                cached = FIRST_PAGE_CACHE.get(cache_key)
+            if cached is not None and cached[0] == generation:
+                response = app.response_class(cached[2], mimetype="application/json")
+                response.set_etag(cached[1])
+                return response.make_conditional(request)
+
+        # Keyset pagination on key avoids O(skip) server work for deep pages;
+        # searches order by text score first, so they always page by skip
+        skip = (page - 1) * per_page
+        keyset = {}
+        if after_key and sort_by == "key" and not query_text:
+            keyset = {"key": {"$gt" if sort_dir == ASCENDING else "$lt": after_key}}
+            skip = 0
+            # The next cursor is read from key, so fetch it even if not requested
+            projection["key"] = 1
 
-        return success_response({
+        if query_text:
+            # Text search is served by the wildcard text index
+            query = {"$text": {"$search": query_text}}
+            # Keys are stored uppercased, so simple queries can also match a
+            # key prefix with an anchored, case-sensitive regex on the key index
+            if query_text.replace("_", "").replace(" ", "").isalnum():
+                key_prefix = query_text.upper().replace(" ", "_")
+                query = {"$or": [query, {"key": Regex(f"^{re.escape(key_prefix)}")}]}
+            projection["score"] = 1
+
+            # One round-trip for both the page and the total match count
+            data_stages = [
+                {"$sort": {"score": DESCENDING, sort_by: sort_dir}},
+                {"$skip": skip},
+                {"$limit": per_page},
+                {"$project": projection}
+            ]
+            pipeline = [
+                {"$match": query},
+                {"$addFields": {"score": {"$meta": "textScore"}}},
+                {"$facet": {"data": data_stages, "meta": [{"$count": "total"}]}}
+            ]
+            result = next(translations_col.aggregate(pipeline), {})
+            raw_docs = result.get("data", [])
+            meta = result.get("meta", [])
+            total = meta[0]["total"] if meta else 0
+        else:
+            raw_docs = translations_col.find(keyset, projection).sort(sort_by, sort_dir).skip(skip).limit(per_page)
+            # Unfiltered listings can use the O(1) collection metadata count
+            total = translations_col.estimated_document_count()
+
+        # orjson renders datetimes natively; the JSON provider stringifies ObjectId
+        docs = list(raw_docs)
+
+        listing = {
             "translations": docs,
             "page": page,
             "per": per_page,
             "total": total,
             "pages": (total + per_page - 1) // per_page
-        })
+        }
+        if keyset:
+            # Cursor paging has no page number; hand back the next cursor instead
+            listing["page"] = None
+            listing["pages"] = None
+            listing["next_after"] = docs[-1].get("key") if len(docs) == per_page else None
+        response = success_response(listing)
+        if cache_key is not None:
+            body = response.get_data()
+            etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+            with CACHE_LOCK:
+                FIRST_PAGE_CACHE[cache_key] = (generation, etag, body)
+            response.set_etag(etag)
+            return response.make_conditional(request)
+        return response
 
     except Exception as e:
         logger.error(f"Error listing translations: {e}")
@@ -389,26 +794,12 @@ def api_add_translation():
         # Normalize key
         key = key_raw.upper().replace(" ", "_")
 
-        # Check if key already exists
-        if translations_col.find_one({"key": key}):
-            return error_response("Translation key already exists")
-
         # Get target languages
         if not target_languages:
-            langs = list(languages_col.find({"code": {"$ne": "en"}}, {"_id": 0}))
-            target_languages = [lang["code"] for lang in langs]
+            target_languages = get_target_language_codes()
 
         # Call translation service
-        values = {"en": en_value}
-        if target_languages:
-            result = call_translation_service(en_value, target_languages)
-            if result.get("success"):
-                values.update(result.get("translations", {}))
-            else:
-                logger.warning(f"Translation service error: {result.get('error')}")
-                # Use fallback format
-                for lang in target_languages:
-                    values[lang] = f"[{lang}] {en_value}"
+        values = translate_values(en_value, target_languages)
 
         # Insert document
         now = datetime.utcnow()
@@ -418,7 +809,11 @@ def api_add_translation():
             "created_at": now,
             "updated_at": now
         }
-        result = translations_col.insert_one(doc)
+        # The unique index on key rejects duplicates
+        try:
+            result = translations_col.insert_one(doc)
+        except DuplicateKeyError:
+            return error_response("Translation key already exists")
         doc["_id"] = str(result.inserted_id)
 
         push_event({
@@ -428,7 +823,7 @@ def api_add_translation():
         })
 
         logger.info(f"Translation added: {key}")
-        return success_response({"translation": serialize_doc(doc)})
+        return success_response({"translation": doc})
 
     except Exception as e:
         logger.error(f"Error adding translation: {e}")
@@ -495,18 +890,10 @@ def api_regenerate_translation(tid):
             return error_response("No English value to translate from")
 
         # Get target languages
-        langs = list(languages_col.find({"code": {"$ne": "en"}}, {"_id": 0}))
-        target_languages = [lang["code"] for lang in langs]
+        target_languages = get_target_language_codes()
 
         # Translate
-        new_values = {"en": en_value}
-        if target_languages:
-            result = call_translation_service(en_value, target_languages)
-            if result.get("success"):
-                new_values.update(result.get("translations", {}))
-            else:
-                for lang in target_languages:
-                    new_values[lang] = f"[{lang}] {en_value}"
+        new_values = translate_values(en_value, target_languages)
 
         # Update document
         translations_col.update_one(
@@ -523,7 +910,7 @@ def api_regenerate_translation(tid):
         logger.info(f"Translation regenerated: {tid}")
 
         doc["values"] = new_values
-        return success_response({"translation": serialize_doc(doc)})
+        return success_response({"translation": doc})
 
     except Exception as e:
         logger.error(f"Error regenerating translation: {e}")
@@ -536,17 +923,33 @@ def api_regenerate_translation(tid):
 def api_export_json():
     """Export all translations as JSON"""
     try:
-        docs = [serialize_doc(d) for d in translations_col.find({})]
-        
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".json", mode='w', encoding='utf-8')
-        json.dump(docs, tmp, ensure_ascii=False, indent=2)
-        tmp.close()
-        
-        return send_file(
-            tmp.name,
-            as_attachment=True,
-            download_name=f"translations_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-            mimetype='application/json'
+        cursor = translations_col.find({}, {f: 1 for f in LIST_DEFAULT_FIELDS}).batch_size(500)
+        # Pull the first batch now so connection/query errors still get a 500
+        try:
+            first = next(cursor, None)
+        except Exception:
+            cursor.close()
+            raise
+
+        def generate():
+            try:
+                yield b"["
+                if first is not None:
+                    yield b"\n" + orjson.dumps(first, default=str, option=orjson.OPT_INDENT_2)
+                for d in cursor:
+                    yield b",\n" + orjson.dumps(d, default=str, option=orjson.OPT_INDENT_2)
+                yield b"\n]"
+            except Exception as e:
+                logger.error(f"Error streaming translations export: {e}")
+                raise
+            finally:
+                cursor.close()
+
+        filename = f"translations_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        return Response(
+            generate(),
+            mimetype="application/json",
+            headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
     except Exception as e:
         logger.error(f"Error exporting translations: {e}")
@@ -564,7 +967,7 @@ def health():
         
         # Check translation service
         try:
-            resp = requests.get(f"{TRANSLATION_SERVICE_URL}/health", timeout=2)
+            resp = HEALTH_SESSION.get(f"{TRANSLATION_SERVICE_URL}/health", timeout=2)
             translation_service_status = resp.status_code == 200
         except:
             translation_service_status = False
@@ -586,7 +989,10 @@ def health():
 # ---------------------------
 # Run Application
 # ---------------------------
+# Development server only; in production run the WSGI app under gunicorn
+# (see wsgi.py) so blocking translation calls and SSE clients get real
+# concurrency.
 if __name__ == "__main__":
     logger.info(f"Starting Translation Management Tool on port {PORT}")
     logger.info(f"Debug mode: {DEBUG}")
-    app.run(host="0.0.0.0", port=PORT, debug=DEBUG)
\ No newline at end of file
+    app.run(host="0.0.0.0", port=PORT, debug=DEBUG, threaded=True)
\ No newline at end of file
@@ -685,7 +685,7 @@ async function onAddLanguage() {
             throw new Error(data.error || "Failed to add language");
         }
         
-        showToast(`Language "${name}" added successfully! ${data.translations_updated || 0} translations updated.`, "success");
+        showToast(`Language "${name}" added successfully! Translating existing keys in the background...`, "success");
         
         // Clear form
         document.getElementById("languageCode").value = "";
@@ -754,6 +754,17 @@ function handleSSEEvent(data) {
     } else if (type === "language_added" && data.name) {
         showToast(`New language added: ${data.name}`, "info");
         loadLanguages();
+    } else if (type === "autofill_progress") {
+        showToast(`Translating to ${data.code}: ${data.done}/${data.total}`, "info");
+    } else if (type === "autofill_done") {
+        if (data.error) {
+            showToast(`${data.name}: ${data.error}`, "error");
+        } else {
+            showToast(`${data.name}: ${data.translations_updated || 0} translations updated`, "success");
+        }
+        if (document.getElementById("tab-manage").classList.contains("active")) {
+            loadTranslations(currentPage);
+        }
     }
 }
 
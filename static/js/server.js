@@ -6,6 +6,50 @@ const app = express();
 app.use(express.json());
 app.use(cors());
 
+// Cap simultaneous calls to the (rate-limited) Google endpoint across all requests
+const MAX_CONCURRENT_TRANSLATIONS = Number(process.env.TRANSLATE_CONCURRENCY) || 8;
+let activeTranslations = 0;
+const waitingTranslations = [];
+
+async function limitedTranslate(text, options) {
+    if (activeTranslations >= MAX_CONCURRENT_TRANSLATIONS) {
+        // The releasing call hands its slot straight to us
+        await new Promise((resolve) => waitingTranslations.push(resolve));
+    } else {
+        activeTranslations++;
+    }
+
+    try {
+        return await translate(text, options);
+    } finally {
+        const next = waitingTranslations.shift();
+        if (next) {
+            next();
+        } else {
+            activeTranslations--;
+        }
+    }
+}
+
+// Translate one text into every language concurrently, within the global cap
+async function translateToLanguages(text, languages) {
+    const translated = await Promise.all(languages.map(async (lang) => {
+        try {
+            const result = await limitedTranslate(text, { to: lang });
+            return [lang, result.text];
+        } catch (err) {
+            return [lang, `[${lang}] ${text}`]; // fallback
+        }
+    }));
+
+    return Object.fromEntries(translated);
+}
+
+// HEALTH CHECK
+app.get("/health", (req, res) => {
+    res.json({ status: "ok" });
+});
+
 // MAIN TRANSLATION ROUTE
 app.post("/translate", async (req, res) => {
     try {
@@ -15,17 +59,30 @@ app.post("/translate", async (req, res) => {
             return res.status(400).json({ error: "text and languages[] required" });
         }
 
-        let results = {};
+        const results = await translateToLanguages(text, languages);
 
-        for (const lang of languages) {
-            try {
-                const result = await translate(text, { to: lang });
-                results[lang] = result.text;
-            } catch (err) {
-                results[lang] = `[${lang}] ${text}`; // fallback
-            }
+        res.json({ success: true, translations: results });
+
+    } catch (err) {
+        console.error(err);
+        res.status(500).json({ error: "Translation failed" });
+    }
+});
+
+// BATCH TRANSLATION ROUTE
+// translations[i] holds { lang: text } for texts[i]
+app.post("/translate/batch", async (req, res) => {
+    try {
+        const { texts, languages } = req.body;
+
+        if (!texts || !Array.isArray(texts) || !languages || !Array.isArray(languages)) {
+            return res.status(400).json({ error: "texts[] and languages[] required" });
         }
 
+        const results = await Promise.all(
+            texts.map((text) => translateToLanguages(text, languages))
+        );
+
         res.json({ success: true, translations: results });
 
     } catch (err) {
@@ -0,0 +1,8 @@
+# wsgi.py
+"""
+WSGI entry point for production servers, e.g.:
+
+    gunicorn -k gevent -w 1 --worker-connections 2000 wsgi:app
+"""
+
+from app import app  # noqa: F401